@@ -6,9 +6,12 @@ loaded from environment variables.
 
 from __future__ import annotations
 
+import json
 import os
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache
+from pathlib import Path
 from typing import Any
 
 from typing_extensions import TypedDict
@@ -36,7 +39,20 @@ class SearchToolSchema(TypedDict):
     inputSchema: dict[str, Any]
 
 
-@dataclass
+SEARCH_TOOL_SCHEMA_PATH = Path(__file__).parent / "search_tool_schema.json"
+
+
+@cache
+def load_search_tool_schema() -> SearchToolSchema:
+    """Read the SearchMemory tool schema once per process; treat it as read-only."""
+    try:
+        with open(SEARCH_TOOL_SCHEMA_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        raise RuntimeError(f"Failed to load search tool schema: {e}") from e
+
+
+@dataclass(frozen=True, slots=True)
 class FegisConfig:
     """Configuration for Fegis server loaded from environment variables."""
 
@@ -51,24 +67,22 @@ class FegisConfig:
     qdrant_api_key: str | None = None
     prefer_grpc: bool = True
     grpc_port: int = 6334
+    hnsw_m: int = 16
+    hnsw_ef_construct: int = 100
+    scalar_quantization: bool = False
     transport: str = TransportType.STDIO.value
     server_name: str = "fegis"
     schema_version: str = "1.0"
     fegis_version: str = "2.0.0"
     debug: bool = False
+    cache_dir: str = "~/.cache/fegis"
+    skip_collection_check: bool = False
     search_tool_schema: SearchToolSchema | None = None
 
     def __post_init__(self):
         """Load the search tool schema from the JSON file after initialization."""
-        import json
-        from pathlib import Path
-
-        schema_path = Path(__file__).parent / "search_tool_schema.json"
-        try:
-            with open(schema_path, encoding="utf-8") as f:
-                self.search_tool_schema = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            raise RuntimeError(f"Failed to load search tool schema: {e}") from e
+        # Frozen dataclass: assign the derived field through object
+        object.__setattr__(self, "search_tool_schema", load_search_tool_schema())
 
     @classmethod
     def from_env(cls) -> FegisConfig:
@@ -86,6 +100,13 @@ class FegisConfig:
             qdrant_api_key=os.getenv("QDRANT_API_KEY"),
             prefer_grpc=os.getenv("PREFER_GRPC", "true").lower() == "true",
             grpc_port=int(os.getenv("GRPC_PORT", "6334")),
+            hnsw_m=int(os.getenv("HNSW_M", "16")),
+            hnsw_ef_construct=int(os.getenv("HNSW_EF_CONSTRUCT", "100")),
+            scalar_quantization=os.getenv("SCALAR_QUANTIZATION", "false").lower()
+            == "true",
             transport=os.getenv("TRANSPORT", "stdio"),
             debug=os.getenv("DEBUG", "false").lower() == "true",
+            cache_dir=os.getenv("CACHE_DIR", "~/.cache/fegis"),
+            skip_collection_check=os.getenv("SKIP_COLLECTION_CHECK", "false").lower()
+            == "true",
         )
@@ -7,7 +7,9 @@ validation via fastjsonschema.
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +28,8 @@ type ValidationResult = tuple[dict[str, Any], list[str]]
 __all__ = [
     "load_archetype",
     "create_tool_schemas",
+    "create_tool_layouts",
+    "ToolLayout",
     "ArchetypeData",
     "ToolSchema",
     "ToolSchemas",
@@ -57,6 +61,30 @@ STANDARD_FIELD_DESCRIPTIONS = {
     "Context": "Relevant context that informed this response",
 }
 
+# Frame type names mapped to JSON Schema types
+FRAME_TYPE_MAPPING = {
+    "list": "array",
+    "string": "string",
+    "integer": "integer",
+    "number": "number",
+    "boolean": "boolean",
+    "object": "object",
+}
+
+# Prefer the libyaml-backed loader; fall back to pure Python when unavailable
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed archetypes keyed by (resolved path, mtime_ns, size)
+_ARCHETYPE_CACHE: dict[tuple[str, int, int], ArchetypeData] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class ToolLayout:
+    """Argument names a tool accepts, split into parameters and frames."""
+
+    parameter_keys: tuple[str, ...]
+    frame_keys: tuple[str, ...]
+
 
 def load_archetype(path: str) -> ArchetypeData:
     """Load YAML archetype from file."""
@@ -66,11 +94,34 @@ def load_archetype(path: str) -> ArchetypeData:
     if not filepath.exists():
         raise FileNotFoundError(f"Archetype file not found: {path}")
 
-    with open(filepath, encoding="utf-8") as f:
-        try:
-            return yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Failed to parse YAML: {e}") from e
+    stat = filepath.stat()
+    cache_key = (str(filepath.resolve()), stat.st_mtime_ns, stat.st_size)
+    cached = _ARCHETYPE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        # Raw bytes let libyaml detect the encoding and skip a str decode pass
+        archetype_data = _intern_keys(
+            yaml.load(filepath.read_bytes(), Loader=_YAML_LOADER)
+        )
+    except yaml.YAMLError as e:
+        raise ValueError(f"Failed to parse YAML: {e}") from e
+
+    _ARCHETYPE_CACHE[cache_key] = archetype_data
+    return archetype_data
+
+
+def _intern_keys(node: Any) -> Any:
+    """Recursively intern mapping keys so hot-path lookups compare by identity."""
+    if isinstance(node, dict):
+        return {
+            sys.intern(k) if isinstance(k, str) else k: _intern_keys(v)
+            for k, v in node.items()
+        }
+    if isinstance(node, list):
+        return [_intern_keys(item) for item in node]
+    return node
 
 
 def create_tool_validators(
@@ -83,6 +134,21 @@ def create_tool_validators(
     return validators
 
 
+def create_tool_layouts(archetype_data: ArchetypeData) -> dict[str, ToolLayout]:
+    """Precompute per-tool argument layouts used to split invocation arguments."""
+    return {
+        tool_name: ToolLayout(
+            parameter_keys=tuple(
+                dict.fromkeys(
+                    [*STANDARD_FIELDS, *(tool_definition.get(KEY_PARAMETERS) or {})]
+                )
+            ),
+            frame_keys=tuple(tool_definition.get("frames") or {}),
+        )
+        for tool_name, tool_definition in archetype_data.get(KEY_TOOLS, {}).items()
+    }
+
+
 def create_tool_schemas(archetype_data: ArchetypeData) -> ToolSchemas:
     """Create MCP tool schemas from archetype definition."""
     tool_schemas = {}
@@ -194,16 +260,6 @@ def _process_frames(
     frame_properties = {}
     required_frames = []
 
-    # Complete type mapping for all JSON Schema types
-    type_mapping = {
-        "list": "array",
-        "string": "string",
-        "integer": "integer",
-        "number": "number",
-        "boolean": "boolean",
-        "object": "object",
-    }
-
     for frame_name, frame_definition in frame_definitions.items():
         # Handle cases where frame_definition might be None or empty
         frame_definition = (
@@ -213,7 +269,7 @@ def _process_frames(
         frame_type = str(frame_definition.get(KEY_TYPE, KEY_STRING)).lower()
         is_required_frame = frame_definition.get(KEY_REQUIRED, False)
 
-        frame_property = {"type": type_mapping.get(frame_type, frame_type)}
+        frame_property = {"type": FRAME_TYPE_MAPPING.get(frame_type, frame_type)}
 
         # Structured Frame Design Patterns - Only x-required is needed
         if is_required_frame:
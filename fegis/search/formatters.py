@@ -10,6 +10,7 @@ from typing import Any
 __all__ = [
     "ResultView",
     "format_memories",
+    "payload_fields_for_view",
     "format_relative_time",
     "format_content_preview",
 ]
@@ -76,6 +77,37 @@ RESULT_VIEWS = {
 }
 
 
+# Payload keys that view fields are read or derived from (None: not in payload)
+FIELD_PAYLOAD_SOURCES = {
+    "content": "document",
+    "content_preview": "document",
+    "relative_time": "timestamp",
+    "score": None,
+}
+
+# View fields derived from other memory fields rather than copied
+FIELD_PROCESSORS = {
+    "content_preview": lambda m: format_content_preview(
+        m.get("content", ""), CONTENT_PREVIEW_LENGTH
+    ),
+    "relative_time": lambda m: _process_relative_time(m.get("timestamp", "")),
+}
+
+
+def payload_fields_for_view(view_name: str) -> list[str] | bool:
+    """Return the payload keys a view needs, or True for the whole payload."""
+    view_config = RESULT_VIEWS.get(view_name)
+    if not view_config:
+        return True
+
+    payload_fields = {}
+    for field in view_config["fields"]:
+        source = FIELD_PAYLOAD_SOURCES.get(field, field.split(".")[0])
+        if source is not None:
+            payload_fields[source] = None
+    return list(payload_fields)
+
+
 def format_memories(
     memories: list[dict[str, Any]], view_name: str
 ) -> list[dict[str, Any]]:
@@ -94,15 +126,9 @@ def format_memories(
 
 def _get_field_value(memory: dict[str, Any], field: str) -> Any:
     """Get formatted value for a specific field."""
-    field_processors = {
-        "content_preview": lambda m: format_content_preview(
-            m.get("content", ""), CONTENT_PREVIEW_LENGTH
-        ),
-        "relative_time": lambda m: _process_relative_time(m.get("timestamp", "")),
-    }
-
-    if field in field_processors:
-        return field_processors[field](memory)
+    processor = FIELD_PROCESSORS.get(field)
+    if processor is not None:
+        return processor(memory)
     elif "." in field:
         return _get_nested_field_dict(memory, field)
     else:
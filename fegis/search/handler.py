@@ -34,13 +34,15 @@ class SearchHandler:
         # Validate query for search types that require it
         search_type = params["search_type"]
         query = params["query"]
+        has_query = bool(query and query.strip())
+        # Blank related queries would be embedded and searched like real ones
+        queries = [q for q in params.get("queries") or [] if q.strip()]
+        params = {**params, "queries": queries}
 
-        if search_type in ["basic", "by_memory_id"] and (
-            not query or not query.strip()
-        ):
-            raise ValueError(
-                "Query cannot be empty for semantic and by_memory_id searches"
-            )
+        if search_type == "basic" and not (has_query or queries):
+            raise ValueError("Query cannot be empty for semantic searches")
+        if search_type == "by_memory_id" and not has_query:
+            raise ValueError("Query cannot be empty for by_memory_id searches")
 
         strategy = self._strategies.get(search_type)
         if not strategy:
@@ -80,4 +82,6 @@ class SearchHandler:
         if not payload:
             return None
 
-        return {"memory_id": point.id, "score": score, "content": content, **payload}
+        # The embedded text lives under "document"; expose it once, as content
+        fields = {k: v for k, v in payload.items() if k != "document"}
+        return {"memory_id": point.id, "score": score, "content": content, **fields}
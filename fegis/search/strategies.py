@@ -4,6 +4,7 @@ Implements the Strategy pattern for different search methods.
 
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
@@ -12,6 +13,8 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 from qdrant_client import models
 
+from .formatters import payload_fields_for_view
+
 if TYPE_CHECKING:
     from fegis.storage import QdrantStorage
 
@@ -57,12 +60,20 @@ VALID_FIELDS = {
     "schema_version",
 }
 
+# Operators whose timestamp values must be single ISO strings
+TIMESTAMP_BOUND_OPERATORS = frozenset({"after", "before"})
+
 # Performance optimization - cache sorted lists for error messages
 _SORTED_VALID_FIELDS = sorted(VALID_FIELDS)
 _SORTED_VALID_OPERATORS = sorted(VALID_OPERATORS)
 
 # Constants for magic numbers
 EXACT_MATCH_SCORE = 1.0
+FILTER_CACHE_SIZE = 256
+QUANTIZATION_OVERSAMPLING = 2.0
+
+# Built filters keyed by their canonical JSON, shared by all strategies
+_filter_cache: dict[str, models.Filter] = {}
 
 
 class SearchType(str, Enum):
@@ -84,12 +95,80 @@ class SearchStrategy(ABC):
         """Executes a search query and returns a list of ScoredPoint objects."""
         pass
 
+    async def _semantic_query(self, params: dict[str, Any]) -> list[Any]:
+        """Run the query, or a batch of related queries sharing one filter."""
+        query_filter = self._build_structured_filter(params)
+        search_params = self._build_search_params(params)
+        client = self.storage.client
+        limit = params["limit"]
+
+        queries = params.get("queries") or []
+        if not queries:
+            return await client.query(
+                collection_name=self.storage.collection_name,
+                query_text=params["query"],
+                query_filter=query_filter,
+                limit=limit,
+                search_params=search_params,
+            )
+
+        if params["query"].strip():
+            queries = [params["query"], *queries]
+        query_texts = list(dict.fromkeys(queries))
+        logger.info(f"Running batch of {len(query_texts)} queries")
+        batch_results = await client.query_batch(
+            collection_name=self.storage.collection_name,
+            query_texts=query_texts,
+            query_filter=query_filter,
+            limit=limit,
+            params=search_params,
+        )
+
+        # Merge per-query hits, keeping each memory's best score
+        best_hits: dict[Any, Any] = {}
+        for hits in batch_results:
+            for hit in hits:
+                current = best_hits.get(hit.id)
+                if current is None or hit.score > current.score:
+                    best_hits[hit.id] = hit
+        merged = sorted(best_hits.values(), key=lambda hit: hit.score, reverse=True)
+        return merged[:limit]
+
+    def _build_search_params(
+        self, params: dict[str, Any]
+    ) -> models.SearchParams | None:
+        """Build per-query search parameters, if any apply."""
+        hnsw_ef = params.get("hnsw_ef")
+        quantization = None
+        if self.storage.config.scalar_quantization:
+            # Rescore oversampled int8 candidates against the original vectors
+            quantization = models.QuantizationSearchParams(
+                rescore=True, oversampling=QUANTIZATION_OVERSAMPLING
+            )
+        if hnsw_ef is None and quantization is None:
+            return None
+        return models.SearchParams(hnsw_ef=hnsw_ef, quantization=quantization)
+
     def _build_structured_filter(self, params: dict[str, Any]) -> models.Filter | None:
         """Convert filter parameters into Qdrant filter conditions."""
         filters = params.get("filters", [])
         if not filters:
             return None
 
+        # Agents often reuse one filter shape across queries
+        cache_key = json.dumps(filters, sort_keys=True, default=str)
+        cached_filter = _filter_cache.get(cache_key)
+        if cached_filter is not None:
+            return cached_filter
+
+        query_filter = self._compile_filter(filters)
+        if len(_filter_cache) >= FILTER_CACHE_SIZE:
+            _filter_cache.pop(next(iter(_filter_cache)))
+        _filter_cache[cache_key] = query_filter
+        return query_filter
+
+    def _compile_filter(self, filters: list[dict[str, Any]]) -> models.Filter:
+        """Validate filter specs and build the Qdrant filter."""
         # Validate filters before processing
         self._validate_filters(filters)
 
@@ -111,7 +190,7 @@ class SearchStrategy(ABC):
                 )
             must_conditions.append(condition)
 
-        return models.Filter(must=must_conditions) if must_conditions else None
+        return models.Filter(must=must_conditions)
 
     def _map_field_to_key(self, field: str) -> str:
         """Map schema field names to Qdrant payload keys."""
@@ -145,7 +224,7 @@ class SearchStrategy(ABC):
 
             # Validate date formats for timestamp fields
             value = filter_spec["value"]
-            if field == "timestamp" and operator in ["after", "before"]:
+            if field == "timestamp" and operator in TIMESTAMP_BOUND_OPERATORS:
                 if not isinstance(value, str):
                     raise ValueError(
                         "Timestamp filter values must be strings in ISO format"
@@ -161,18 +240,28 @@ class SearchStrategy(ABC):
         self, field_key: str, operator: str, value
     ) -> models.Condition | None:
         """Build a Qdrant condition from instructional operator and value."""
-        logger.info(
-            f"Building condition: field_key={field_key}, operator={operator}, value={value}"
+        # Formatted lazily: filter values are only rendered when debug logging is on
+        logger.debug(
+            "Building condition: field_key={}, operator={}, value={}",
+            field_key,
+            operator,
+            value,
         )
         try:
             match operator:
                 case "is":
+                    # A list of values is answered by one MatchAny lookup
+                    if isinstance(value, list):
+                        return models.FieldCondition(
+                            key=field_key, match=models.MatchAny(any=value)
+                        )
                     return models.FieldCondition(
                         key=field_key, match=models.MatchValue(value=value)
                     )
                 case "is_not":
+                    excluded = value if isinstance(value, list) else [value]
                     return models.FieldCondition(
-                        key=field_key, match=models.MatchExcept(**{"except": [value]})
+                        key=field_key, match=models.MatchExcept(**{"except": excluded})
                     )
                 case "before":
                     if field_key == "timestamp":
@@ -185,8 +274,8 @@ class SearchStrategy(ABC):
                     )
                 case "after":
                     if field_key == "timestamp":
-                        logger.info(
-                            f"Datetime value type: {type(value)}, value: {value}"
+                        logger.debug(
+                            "Datetime value type: {}, value: {}", type(value), value
                         )
                         if isinstance(value, str):
                             dt_value = datetime.fromisoformat(
@@ -264,31 +353,39 @@ class BasicSearchStrategy(SearchStrategy):
 
     async def search(self, params: dict[str, Any]) -> list[models.ScoredPoint]:
         logger.info(f"Performing basic search for: '{params['query']}'")
-        return await self.storage.client.query(
-            collection_name=self.storage.collection_name,
-            query_text=params["query"],
-            query_filter=self._build_structured_filter(params),
-            limit=params["limit"],
-        )
+        return await self._semantic_query(params)
 
 
 class FilteredSearchStrategy(SearchStrategy):
     """Filtered search using structured query filters."""
 
     async def search(self, params: dict[str, Any]) -> list[models.ScoredPoint]:
-        query = params["query"]
         filters = params["filters"]
-        limit = params["limit"]
 
         logger.info(f"Performing filtered search with {len(filters)} filters")
 
-        # Always use semantic query (even with empty string for consistent scoring)
-        return await self.storage.client.query(
+        if params["query"].strip() or params.get("queries"):
+            return await self._semantic_query(params)
+
+        # Without query text, skip embedding and ANN: newest matches first
+        points, _ = await self.storage.client.scroll(
             collection_name=self.storage.collection_name,
-            query_text=query,  # Use empty string if no query provided
-            query_filter=self._build_structured_filter(params),
-            limit=limit,
+            scroll_filter=self._build_structured_filter(params),
+            limit=params["limit"],
+            order_by=models.OrderBy(key="timestamp", direction=models.Direction.DESC),
+            with_payload=payload_fields_for_view(params.get("detail", "summary")),
+            with_vectors=False,
         )
+        return [
+            models.ScoredPoint(
+                id=point.id,
+                version=0,
+                score=EXACT_MATCH_SCORE,
+                payload=point.payload,
+                vector=None,
+            )
+            for point in points
+        ]
 
 
 class ByIdSearchStrategy(SearchStrategy):
@@ -301,7 +398,7 @@ class ByIdSearchStrategy(SearchStrategy):
         points = await self.storage.client.retrieve(
             collection_name=self.storage.collection_name,
             ids=[memory_id],
-            with_payload=True,
+            with_payload=payload_fields_for_view(params.get("detail", "summary")),
             with_vectors=False,
         )
 
@@ -13,9 +13,10 @@ from mcp.server.models import InitializationOptions, ServerCapabilities
 
 from .config import FegisConfig
 from .schema import (
-    STANDARD_FIELDS,
     ArchetypeData,
+    ToolLayout,
     ToolSchemas,
+    create_tool_layouts,
     create_tool_schemas,
     create_tool_validators,
     load_archetype,
@@ -39,23 +40,50 @@ def initialize_storage(config: FegisConfig) -> QdrantStorage:
 
 def load_archetype_tools(
     config: FegisConfig,
-) -> tuple[ArchetypeData, ToolSchemas, dict[str, Any]]:
-    """Load archetype data, create schemas, and compile validators."""
+) -> tuple[ArchetypeData, ToolSchemas, dict[str, Any], dict[str, ToolLayout]]:
+    """Load archetype data, create schemas, compile validators and tool layouts."""
     try:
         archetype_data = load_archetype(config.archetype_path)
         tool_schemas = create_tool_schemas(archetype_data)
         tool_validators = create_tool_validators(tool_schemas)
+        tool_layouts = create_tool_layouts(archetype_data)
         print(
             f"[OK] Loaded archetype: {archetype_data.get('title', 'Unknown')}",
             file=sys.stderr,
         )
         print(f"[OK] Generated {len(tool_schemas)} tool schemas", file=sys.stderr)
-        return archetype_data, tool_schemas, tool_validators
+        return archetype_data, tool_schemas, tool_validators, tool_layouts
     except Exception as e:
         print(f"[ERROR] Archetype loading error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def build_tool_list(
+    config: FegisConfig, archetype_data: ArchetypeData, tool_schemas: ToolSchemas
+) -> list[types.Tool]:
+    """Build the MCP tool definitions once; they are fixed for the server's lifetime."""
+    tools = []
+    for tool_name, schema in tool_schemas.items():
+        tool_definition = archetype_data["tools"][tool_name]
+        tools.append(
+            types.Tool(
+                name=tool_name,
+                description=tool_definition.get("description", ""),
+                inputSchema=schema["inputSchema"],
+            )
+        )
+
+    search_tool_config = config.search_tool_schema
+    tools.append(
+        types.Tool(
+            name=search_tool_config["name"],
+            description=search_tool_config["description"],
+            inputSchema=search_tool_config["inputSchema"],
+        )
+    )
+    return tools
+
+
 def return_tool_error(error_msg: str) -> str:
     """Clean up validation error messages for better AI understanding."""
     if "Cannot convert undefined or null to object" in error_msg:
@@ -71,18 +99,13 @@ async def handle_archetype_tool(
     arguments: dict,
     archetype_data: ArchetypeData,
     tool_validators: dict[str, Any],
+    tool_layout: ToolLayout,
     storage: QdrantStorage,
     server_session_id: str,
 ) -> dict:
     """Execute archetype tool, validate inputs, and store as memory."""
-    tool_definition = archetype_data["tools"][name]
-
-    tool_parameter_keys = set(tool_definition.get("parameters", {}).keys())
-    all_parameter_keys = tool_parameter_keys | set(STANDARD_FIELDS)
-    parameters = {k: v for k, v in arguments.items() if k in all_parameter_keys}
-
-    frame_field_keys = set(tool_definition.get("frames", {}).keys())
-    frames = {k: v for k, v in arguments.items() if k in frame_field_keys}
+    parameters = {k: arguments[k] for k in tool_layout.parameter_keys if k in arguments}
+    frames = {k: arguments[k] for k in tool_layout.frame_keys if k in arguments}
 
     complete_response = {**parameters, **frames}
     try:
@@ -119,11 +142,13 @@ async def handle_search_tool(arguments: dict, search_handler: SearchHandler) ->
     """Execute search tool and return formatted results."""
     search_args = {
         "query": arguments.get("query", ""),
+        "queries": arguments.get("queries", []),
         "limit": arguments.get("limit", 3),
         "search_type": arguments.get("search_type", "basic"),
         "detail": arguments.get("detail", "summary"),
         "score_threshold": arguments.get("score_threshold", 0.4),
         "filters": arguments.get("filters", []),
+        "hnsw_ef": arguments.get("hnsw_ef"),
     }
     found_memories = await search_handler.search(search_args)
 
@@ -143,49 +168,37 @@ def main() -> int:
         return 1
 
     storage = initialize_storage(config)
-    archetype_data, tool_schemas, tool_validators = load_archetype_tools(config)
+    archetype_data, tool_schemas, tool_validators, tool_layouts = load_archetype_tools(
+        config
+    )
 
     mcp_server = Server(config.server_name)
     search_handler = SearchHandler(storage)
     server_session_id = str(uuid.uuid4())
     print(f"[OK] Server session: {server_session_id}", file=sys.stderr)
 
+    available_tools = build_tool_list(config, archetype_data, tool_schemas)
+    search_tool_name = config.search_tool_schema["name"]
+    archetype_tools = archetype_data["tools"]
+
     @mcp_server.list_tools()
     async def list_tools() -> list[types.Tool]:
         """Return all available archetype and search tools."""
-        tools = []
-        for tool_name, schema in tool_schemas.items():
-            tool_definition = archetype_data["tools"][tool_name]
-            tools.append(
-                types.Tool(
-                    name=tool_name,
-                    description=tool_definition.get("description", ""),
-                    inputSchema=schema["inputSchema"],
-                )
-            )
-
-        search_tool_config = config.search_tool_schema
-        tools.append(
-            types.Tool(
-                name=search_tool_config["name"],
-                description=search_tool_config["description"],
-                inputSchema=search_tool_config["inputSchema"],
-            )
-        )
-        return tools
+        return available_tools
 
     @mcp_server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
         """Route tool calls to appropriate handlers and return JSON responses."""
         try:
-            if name == config.search_tool_schema["name"]:
+            if name == search_tool_name:
                 result = await handle_search_tool(arguments, search_handler)
-            elif name in archetype_data["tools"]:
+            elif name in archetype_tools:
                 result = await handle_archetype_tool(
                     name,
                     arguments,
                     archetype_data,
                     tool_validators,
+                    tool_layouts[name],
                     storage,
                     server_session_id,
                 )
@@ -213,6 +226,7 @@ def main() -> int:
         async def run_server() -> None:
             try:
                 await storage.initialize()
+                await storage.warm_up()
                 print("[OK] Storage initialized", file=sys.stderr)
                 print(
                     "[READY] Fegis MCP server startup complete - ready for connections",
@@ -228,8 +242,14 @@ def main() -> int:
                 capabilities=ServerCapabilities(tools={}),
             )
 
-            async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-                await mcp_server.run(read_stream, write_stream, init_options)
+            try:
+                async with mcp.server.stdio.stdio_server() as (
+                    read_stream,
+                    write_stream,
+                ):
+                    await mcp_server.run(read_stream, write_stream, init_options)
+            finally:
+                await storage.close()
 
         anyio.run(run_server)
 
@@ -2,19 +2,66 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
-import uuid
+import os
+import time
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypedDict
 
+import httpx
 from loguru import logger
 from qdrant_client import AsyncQdrantClient, models
 
+from .schema import STANDARD_FIELDS
+
 if TYPE_CHECKING:
     from .config import FegisConfig
 
 __all__ = ["QdrantStorage"]
 
+# Random bytes drawn per os.urandom call when minting memory IDs (256 IDs)
+RANDOM_POOL_SIZE = 4096
+
+# Standard fields are stored as top-level payload keys, not under parameters/frames
+_STANDARD_FIELD_KEYS = frozenset(STANDARD_FIELDS)
+
+# Payload indexes backing the semantic-first payload structure
+PAYLOAD_INDEXES = {
+    "title": models.PayloadSchemaType.TEXT,
+    "context": models.PayloadSchemaType.TEXT,
+    "tool": models.PayloadSchemaType.KEYWORD,
+    "session_id": models.PayloadSchemaType.KEYWORD,
+    "sequence_order": models.PayloadSchemaType.INTEGER,
+    "memory_id": models.PayloadSchemaType.KEYWORD,
+    "timestamp": models.PayloadSchemaType.DATETIME,
+    "preceding_memory_id": models.PayloadSchemaType.KEYWORD,
+    "meta.agent_id": models.PayloadSchemaType.KEYWORD,
+    "meta.archetype_title": models.PayloadSchemaType.KEYWORD,
+    "meta.archetype_version": models.PayloadSchemaType.KEYWORD,
+    "meta.schema_version": models.PayloadSchemaType.KEYWORD,
+}
+
+# Concurrent create_payload_index requests and how long to wait for them to land
+INDEX_BUILD_CONCURRENCY = 8
+INDEX_POLL_INTERVAL = 0.05
+INDEX_WAIT_TIMEOUT = 30.0
+
+# Share of vector values kept inside the int8 range when quantization is on
+SCALAR_QUANTILE = 0.99
+
+# Concurrent memory writes are coalesced into one add() of up to this many items,
+# waiting at most WRITE_BATCH_DELAY seconds for a batch to fill
+WRITE_BATCH_SIZE = 32
+WRITE_BATCH_DELAY = 0.01
+
+# Connection pool for the REST transport (used when gRPC is disabled)
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=200, max_keepalive_connections=100, keepalive_expiry=60
+)
+
 
 class Provenance(TypedDict):
     """Type definition for the provenance data structure."""
@@ -24,66 +71,206 @@ class Provenance(TypedDict):
     preceding_memory_id: str | None
 
 
+def _strip_standard_fields(values: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of values without the Title/Content/Context fields."""
+    if _STANDARD_FIELD_KEYS.isdisjoint(values):
+        return dict(values)
+    stripped = dict(values)
+    for key in _STANDARD_FIELD_KEYS:
+        stripped.pop(key, None)
+    return stripped
+
+
+type _PendingWrite = tuple[str, dict[str, Any], str, asyncio.Future[None]]
+
+
+class _BatchWriter:
+    """Coalesces concurrent memory writes into batched embedding + upsert calls."""
+
+    def __init__(self, client: AsyncQdrantClient, collection_name: str) -> None:
+        self._client = client
+        self._collection_name = collection_name
+        self._queue: asyncio.Queue[_PendingWrite | None] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    async def write(
+        self, document: str, payload: dict[str, Any], point_id: str
+    ) -> None:
+        """Queue one memory and wait until the batch containing it is stored."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((document, payload, point_id, future))
+        await future
+
+    async def close(self) -> None:
+        """Flush queued writes and stop the background task."""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = loop.time() + WRITE_BATCH_DELAY
+            stopping = False
+            while len(batch) < WRITE_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, batch: list[_PendingWrite]) -> None:
+        try:
+            await self._client.add(
+                collection_name=self._collection_name,
+                documents=[document for document, _, _, _ in batch],
+                metadata=[payload for _, payload, _, _ in batch],
+                ids=[point_id for _, _, point_id, _ in batch],
+            )
+        except Exception as e:
+            if len(batch) > 1:
+                # Retry one at a time so one bad write can't fail its neighbours
+                logger.warning(
+                    f"Failed to store batch of {len(batch)} memories, "
+                    f"retrying individually: {e}"
+                )
+                for item in batch:
+                    await self._flush([item])
+                return
+            logger.error(f"Failed to store memory: {e}")
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            if len(batch) > 1:
+                logger.info(f"Stored batch of {len(batch)} memories")
+            for *_, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+
 class QdrantStorage:
     """Manages all communication with the Qdrant collection."""
 
     def __init__(self, config: FegisConfig) -> None:
         self.config = config
         self.collection_name = config.collection_name
+
+        rest_options: dict[str, Any] = {}
+        if not config.prefer_grpc:
+            # Keep REST connections warm between bursts
+            rest_options = {"limits": HTTP_POOL_LIMITS}
+
         self.client = AsyncQdrantClient(
             url=config.qdrant_url,
             api_key=config.qdrant_api_key,
             prefer_grpc=config.prefer_grpc,
             grpc_port=config.grpc_port,
+            **rest_options,
         )
+        self._random_pool = b""
+        self._random_offset = 0
+        self._writer = _BatchWriter(self.client, self.collection_name)
 
     async def initialize(self) -> None:
         """Sets up embedding models and ensures the collection exists."""
         import sys
 
-        print(
-            "[INIT] Initializing Qdrant storage and embedding models...",
-            file=sys.stderr,
+        if self.config.debug:
+            print(
+                "[INIT] Initializing Qdrant storage and embedding models...",
+                file=sys.stderr,
+            )
+            print(
+                f"[INIT] Setting dense embedding model: {self.config.embedding_model}",
+                file=sys.stderr,
+            )
+        skip_checks = self.config.skip_collection_check
+        # set_model blocks on the ONNX load; overlap it with the existence check
+        model_ready = asyncio.to_thread(
+            self.client.set_model, self.config.embedding_model
         )
 
-        print(
-            f"[INIT] Setting dense embedding model: {self.config.embedding_model}",
-            file=sys.stderr,
-        )
-        self.client.set_model(self.config.embedding_model)
-        print("[OK] Dense model ready", file=sys.stderr)
+        if skip_checks:
+            await model_ready
+        else:
+            try:
+                _, exists = await asyncio.gather(
+                    model_ready, self.client.collection_exists(self.collection_name)
+                )
+            except Exception as e:
+                logger.error(f"Error loading model or checking collection: {e}")
+                raise
+        print(f"[OK] Dense model ready: {self.config.embedding_model}", file=sys.stderr)
+
+        if skip_checks:
+            if self.config.debug:
+                print(
+                    f"[INIT] Skipping collection checks for '{self.collection_name}'",
+                    file=sys.stderr,
+                )
+            return
 
         try:
-            exists = await self.client.collection_exists(self.collection_name)
             if exists:
                 logger.info(f"Collection '{self.collection_name}' already exists.")
             else:
                 logger.info(f"Creating collection '{self.collection_name}'.")
                 await self.client.create_collection(
                     collection_name=self.collection_name,
-                    vectors_config=self.client.get_fastembed_vector_params(),
+                    # Quantized vectors stay in RAM; originals are only read to rescore
+                    vectors_config=self.client.get_fastembed_vector_params(
+                        on_disk=self.config.scalar_quantization or None
+                    ),
+                    hnsw_config=models.HnswConfigDiff(
+                        m=self.config.hnsw_m,
+                        ef_construct=self.config.hnsw_ef_construct,
+                    ),
+                    quantization_config=self._quantization_config(),
                 )
         except Exception as e:
             logger.error(f"Error checking/creating collection: {e}")
             raise
-        await self.ensure_indexes()
+        # The marker only skips the index check; a recreated collection has none
+        await self.ensure_indexes(force=not exists)
 
-    async def ensure_indexes(self) -> None:
+    def _quantization_config(self) -> models.ScalarQuantization | None:
+        """Int8 scalar quantization for new collections, when enabled."""
+        if not self.config.scalar_quantization:
+            return None
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=SCALAR_QUANTILE,
+                always_ram=True,
+            )
+        )
+
+    async def ensure_indexes(self, force: bool = False) -> None:
         """Creates indexes for the semantic-first payload structure."""
-        desired_indexes = {
-            "title": models.PayloadSchemaType.TEXT,
-            "context": models.PayloadSchemaType.TEXT,
-            "tool": models.PayloadSchemaType.KEYWORD,
-            "session_id": models.PayloadSchemaType.KEYWORD,
-            "sequence_order": models.PayloadSchemaType.INTEGER,
-            "memory_id": models.PayloadSchemaType.KEYWORD,
-            "timestamp": models.PayloadSchemaType.DATETIME,
-            "preceding_memory_id": models.PayloadSchemaType.KEYWORD,
-            "meta.agent_id": models.PayloadSchemaType.KEYWORD,
-            "meta.archetype_title": models.PayloadSchemaType.KEYWORD,
-            "meta.archetype_version": models.PayloadSchemaType.KEYWORD,
-            "meta.schema_version": models.PayloadSchemaType.KEYWORD,
-        }
+        marker = self._index_marker_path()
+        if not force and marker.exists():
+            logger.info("Payload indexes already verified; skipping check.")
+            return
+
         try:
             collection_info = await self.client.get_collection(self.collection_name)
             existing_indexes = (
@@ -92,24 +279,81 @@ class QdrantStorage:
                 else set()
             )
             missing_indexes = {
-                k: v for k, v in desired_indexes.items() if k not in existing_indexes
+                k: v for k, v in PAYLOAD_INDEXES.items() if k not in existing_indexes
             }
             if not missing_indexes:
                 logger.info("All required payload indexes are in place.")
+                self._write_index_marker(marker)
                 return
 
             logger.info(f"Creating missing indexes: {list(missing_indexes.keys())}")
-            for field_name, schema_type in missing_indexes.items():
-                await self.client.create_payload_index(
-                    collection_name=self.collection_name,
-                    field_name=field_name,
-                    field_schema=schema_type,
-                    wait=True,
-                )
+            semaphore = asyncio.Semaphore(INDEX_BUILD_CONCURRENCY)
+
+            async def create_index(
+                field_name: str, schema_type: models.PayloadSchemaType
+            ) -> None:
+                async with semaphore:
+                    await self.client.create_payload_index(
+                        collection_name=self.collection_name,
+                        field_name=field_name,
+                        field_schema=schema_type,
+                        wait=False,
+                    )
+
+            await asyncio.gather(
+                *(create_index(k, v) for k, v in missing_indexes.items())
+            )
+            await self._wait_for_indexes(set(missing_indexes))
             logger.info("Successfully created payload indexes.")
+            self._write_index_marker(marker)
         except Exception as e:
             logger.error(f"Failed to ensure indexes: {e}")
 
+    async def _wait_for_indexes(self, field_names: set[str]) -> None:
+        """Poll the collection until all requested payload indexes are present."""
+        async with asyncio.timeout(INDEX_WAIT_TIMEOUT):
+            while True:
+                collection_info = await self.client.get_collection(self.collection_name)
+                if field_names <= set(collection_info.payload_schema or {}):
+                    return
+                await asyncio.sleep(INDEX_POLL_INTERVAL)
+
+    def _index_marker_path(self) -> Path:
+        """Path of the marker recording that this collection's indexes exist."""
+        signature = json.dumps(
+            [
+                self.config.qdrant_url,
+                self.collection_name,
+                self.config.schema_version,
+                sorted((k, v.value) for k, v in PAYLOAD_INDEXES.items()),
+            ]
+        )
+        digest = hashlib.sha256(signature.encode()).hexdigest()[:16]
+        return (
+            Path(self.config.cache_dir).expanduser()
+            / f"indexed-{self.collection_name}-{digest}"
+        )
+
+    @staticmethod
+    def _write_index_marker(marker: Path) -> None:
+        """Record that indexes are in place; failures only cost a future RTT."""
+        try:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError as e:
+            logger.warning(f"Could not write index marker {marker}: {e}")
+
+    async def warm_up(self) -> None:
+        """Runs one throwaway query so the first real call skips model cold start."""
+        try:
+            await self.client.query(
+                collection_name=self.collection_name,
+                query_text="warmup",
+                limit=1,
+            )
+        except Exception as e:
+            logger.warning(f"Embedding model warmup failed: {e}")
+
     async def get_last_memory_for_session(
         self, session_id: str
     ) -> tuple[str | None, int]:
@@ -126,7 +370,8 @@ class QdrantStorage:
                 ),
                 order_by=models.OrderBy(key="sequence_order", direction="desc"),
                 limit=1,
-                with_payload=True,
+                with_payload=["memory_id", "sequence_order"],
+                with_vectors=False,
             )
 
             if scroll_results:
@@ -159,16 +404,10 @@ class QdrantStorage:
             memory_content or f"Tool: {tool_name}\n{json.dumps(frames, indent=2)}"
         )
 
-        filtered_parameters = {
-            k: v
-            for k, v in parameters.items()
-            if k not in ["Title", "Content", "Context"]
-        }
-        filtered_frames = {
-            k: v for k, v in frames.items() if k not in ["Title", "Content", "Context"]
-        }
+        filtered_parameters = _strip_standard_fields(parameters)
+        filtered_frames = _strip_standard_fields(frames)
 
-        memory_id = str(uuid.uuid4())
+        memory_id = self._new_memory_id()
 
         memory_payload = {
             "title": memory_title,
@@ -190,15 +429,27 @@ class QdrantStorage:
             },
         }
 
+        await self._writer.write(document_text, memory_payload, memory_id)
         logger.info(f"'{tool_name}' stored with memory_id '{memory_id}'")
-        await self.client.add(
-            collection_name=self.collection_name,
-            documents=[document_text],
-            metadata=[memory_payload],
-            ids=[memory_id],
-        )
         return memory_id
 
+    def _new_memory_id(self) -> str:
+        """Return a time-ordered UUIDv7 string using pooled urandom bytes."""
+        if self._random_offset >= len(self._random_pool):
+            self._random_pool = os.urandom(RANDOM_POOL_SIZE)
+            self._random_offset = 0
+        raw = bytearray(
+            self._random_pool[self._random_offset : self._random_offset + 16]
+        )
+        self._random_offset += 16
+
+        raw[0:6] = (time.time_ns() // 1_000_000).to_bytes(6, "big")  # unix ms
+        raw[6] = (raw[6] & 0x0F) | 0x70  # version 7
+        raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 9562 variant
+        h = raw.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
     async def close(self) -> None:
-        """Closes the connection to Qdrant."""
+        """Flushes pending writes and closes the connection to Qdrant."""
+        await self._writer.close()
         await self.client.close()
@@ -0,0 +1,76 @@
+"""Tests for the batched memory writer in fegis.storage."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from fegis.storage import WRITE_BATCH_SIZE, _BatchWriter
+
+
+class FakeClient:
+    """Records add() calls and fails any call that includes a rejected ID."""
+
+    def __init__(self, rejected_ids: frozenset[str] = frozenset()) -> None:
+        self.rejected_ids = rejected_ids
+        self.calls: list[list[str]] = []
+
+    async def add(self, collection_name, documents, metadata, ids):
+        self.calls.append(list(ids))
+        if self.rejected_ids.intersection(ids):
+            raise RuntimeError("rejected")
+
+
+def _write(writer: _BatchWriter, point_id: str):
+    return writer.write(f"doc {point_id}", {"memory_id": point_id}, point_id)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_are_batched():
+    client = FakeClient()
+    writer = _BatchWriter(client, "test_collection")
+    point_ids = [str(i) for i in range(WRITE_BATCH_SIZE * 2 + 6)]
+
+    await asyncio.gather(*(_write(writer, point_id) for point_id in point_ids))
+    await writer.close()
+
+    assert [len(call) for call in client.calls] == [
+        WRITE_BATCH_SIZE,
+        WRITE_BATCH_SIZE,
+        6,
+    ]
+    assert [point_id for call in client.calls for point_id in call] == point_ids
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_only_fails_the_bad_write():
+    client = FakeClient(rejected_ids=frozenset({"bad"}))
+    writer = _BatchWriter(client, "test_collection")
+
+    results = await asyncio.gather(
+        _write(writer, "a"),
+        _write(writer, "bad"),
+        _write(writer, "b"),
+        return_exceptions=True,
+    )
+    await writer.close()
+
+    assert results[0] is None
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] is None
+    # One failed batch, then one retry per item
+    assert client.calls == [["a", "bad", "b"], ["a"], ["bad"], ["b"]]
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_writes():
+    client = FakeClient()
+    writer = _BatchWriter(client, "test_collection")
+
+    pending = asyncio.create_task(_write(writer, "last"))
+    await asyncio.sleep(0)
+    await writer.close()
+    await pending
+
+    assert client.calls == [["last"]]